@@ -69,41 +69,52 @@ class MyOffsetModel(QtSql.QSqlTableModel):
         self.metric_display = True
         self.highlight_color = '#20A0A0'
         self.tool_list = []
+        self._tool_set = set()
+        self._tno_to_row = {}
         rec = self.record()
         for i in range(rec.count()):
             hdr = rec.fieldName(i)
             self.setHeaderData(i, Qt.Horizontal, hdr)
             if i > 1: offset_headers[hdr] = i
+        self._col_order = tuple(offset_headers.values())
+        self._col_to_field = tuple(rec.fieldName(i) for i in range(rec.count()))
+        self._handled_roles = frozenset({Qt.DisplayRole, Qt.EditRole, Qt.BackgroundRole,
+                                         Qt.TextAlignmentRole, Qt.CheckStateRole})
+        self._float_fmt = "{:.3f}".format
+        self._bg_chk_col = QColor('#809090')
+        self._bg_highlight = QColor(self.highlight_color)
+        self._align_left = Qt.AlignLeft | Qt.AlignVCenter
+        self._align_center = Qt.AlignCenter
+        self._comment_col = offset_headers['Comment']
         self.select()
         self.update()
 
     def data(self, index, role=Qt.DisplayRole):
-        value = super(MyOffsetModel, self).data(index, role)
+        if role not in self._handled_roles: return QVariant()
         if index.column() == 1:
             if role == Qt.BackgroundRole:
-                return QColor('#809090')
+                return self._bg_chk_col
             if role == Qt.CheckStateRole:
                 checked = super(MyOffsetModel, self).data(index, Qt.DisplayRole)
                 if int(checked) == 1: return Qt.Checked
                 else: return Qt.Unchecked
             else: return QVariant()
         if role == Qt.EditRole:
-            return value
+            return super(MyOffsetModel, self).data(index, role)
         if role == Qt.DisplayRole:
+            value = super(MyOffsetModel, self).data(index, role)
             if isinstance(value, float):
-                if self.metric_display:
-                    return "{:.3f}".format(value)
-                else: return "{:.4f}".format(value)
+                return self._float_fmt(value)
             return value
         if role == Qt.TextAlignmentRole:
-            if index.column() == offset_headers['Comment']:
-                return (Qt.AlignLeft | Qt.AlignVCenter)
+            if index.column() == self._comment_col:
+                return self._align_left
             else:
-                return Qt.AlignCenter
+                return self._align_center
         if role == Qt.BackgroundRole:
             if self.parent.current_row is None: return QVariant()
             if index.row() == self.parent.current_row:
-                return QColor(self.highlight_color)
+                return self._bg_highlight
         return QVariant()
 
     def setData(self, index, value, role=Qt.EditRole):
@@ -132,62 +143,85 @@ class MyOffsetModel(QtSql.QSqlTableModel):
     def sort(self, column, order):
         if column != 1: super(MyOffsetModel, self).sort(column, order)
 
+    def select(self):
+        ok = super(MyOffsetModel, self).select()
+        self._tno_to_row = {self.record(row).value('Tool'): row for row in range(super().rowCount())}
+        return ok
+
+    def set_metric_mode(self, state):
+        self.metric_display = state
+        self._float_fmt = ("{:.3f}" if state else "{:.4f}").format
+        self.dataChanged.emit(self.index(0, 0), self.index(self.rowCount(self) - 1, self.columnCount() - 1))
+
     def list_checked_tools(self):
         checked_list = []
         for row in range(super().rowCount()):
-            idx = self.index(row, 1)
-            checked = super().data(idx)
-            if checked == 1:
-                idx = self.index(row, offset_headers['Tool'])
-                tno = super().data(idx)
-                checked_list.append(tno)
+            rec = self.record(row)
+            if rec.value('Chk') == 1:
+                checked_list.append(rec.value('Tool'))
         return checked_list
 
     def update(self):
         LOG.debug("Updating offset model")
-        self.tool_list = []
-        tool_array, wear_model = TOOL.GET_TOOL_MODELS()
-        for line in tool_array:
-            tno = line[0]
-            self.tool_list.append(tno)
-            # look for lines to add
-            row = self.get_index(tno)
-            if row is None:
-                self.addrow(line)
-            else:
-                self.update_row(row, line)
-        # look for lines to delete
-        delete_list = []
-        col = offset_headers['Tool']
-        for row in range(self.rowCount(self)):
-            idx = self.index(row, col)
-            tno = self.data(idx)
-            if tno not in self.tool_list:
-                delete_list.append(tno)
-        LOG.debug(f"Tools to delete {delete_list}")
-        if delete_list:
-            if len(delete_list) > 1: delete_list.reverse()
-            for tno in delete_list:
-                self.delrow(tno)
+        # batch every INSERT/UPDATE/DELETE of the refresh into one transaction
+        # so sqlite commits once instead of once per statement
+        db = self.database()
+        db.transaction()
+        # hold back the per-cell dataChanged storm while rows are rewritten;
+        # the views get a single layoutChanged once the refresh is done
+        self.blockSignals(True)
+        try:
+            self.tool_list = []
+            tool_array, wear_model = TOOL.GET_TOOL_MODELS()
+            for line in tool_array:
+                tno = line[0]
+                self.tool_list.append(tno)
+                # look for lines to add
+                row = self.get_index(tno)
+                if row is None:
+                    self.addrow(line)
+                else:
+                    self.update_row(row, line)
+            self._tool_set = set(self.tool_list)
+            # look for lines to delete
+            delete_list = []
+            for row in range(self.rowCount(self)):
+                tno = self.record(row).value('Tool')
+                if tno not in self.tool_list:
+                    delete_list.append(tno)
+            LOG.debug(f"Tools to delete {delete_list}")
+            if delete_list:
+                if len(delete_list) > 1: delete_list.reverse()
+                for tno in delete_list:
+                    self.delrow(tno)
+        finally:
+            self.blockSignals(False)
+            db.commit()
+        self.layoutChanged.emit()
         return True
 
     def addrow(self, data):
         # add row to offset table
         row = self.rowCount(self)
         rec = self.record()
-        for i, key in enumerate(offset_headers):
-            rec.setValue(key, data[i])
+        for col, value in zip(self._col_order, data):
+            rec.setValue(col, value)
         rec.setGenerated('idn', False)
         if not self.insertRecord(row, rec): LOG.debug(f"Error: {self.lastError().text()}")
         pkey = self.data(self.index(row, 0))
         tno = data[0]
+        self._tno_to_row[tno] = row
         # add row to tool table
         self.parent.tool_model.addrow(pkey, tno)
 
     def update_row(self, row, data):
-        for i, key in enumerate(offset_headers):
-            idx = self.index(row, offset_headers[key])
-            self.setData(idx, data[i])
+        # write the whole row with one setRecord so a single UPDATE is
+        # issued instead of one per field
+        rec = self.record(row)
+        for col, value in zip(self._col_order, data):
+            rec.setValue(col, value)
+        rec.setGenerated('idn', False)
+        if not self.setRecord(row, rec): LOG.debug(f"Error: {self.lastError().text()}")
 
     def delrow(self, tno):
         row = self.get_index(tno)
@@ -199,22 +233,32 @@ class MyOffsetModel(QtSql.QSqlTableModel):
         self.parent.tool_model.select()
 
     def get_index(self, tno):
-        col = offset_headers['Tool']
-        count = self.rowCount(self)
-        found = None
-        for row in range(count):
-            idx = self.index(row, col)
-            if self.data(idx) == tno:
-                found = row
-                break
-        return found
+        return self._tno_to_row.get(tno)
+
+    def add_one(self, line):
+        # fast path for a single added tool - avoids a full update() resync
+        tno = line[0]
+        row = self.get_index(tno)
+        if row is not None:
+            self.update_row(row, line)
+            return
+        self.tool_list.append(tno)
+        self._tool_set.add(tno)
+        self.addrow(line)
+
+    def remove_one(self, tno):
+        # fast path for a single deleted tool
+        if tno in self._tool_set:
+            self.tool_list.remove(tno)
+            self._tool_set.discard(tno)
+        self.delrow(tno)
 
     def uncheck_all_tools(self):
-        rows = super().rowCount()
-        for row in range(rows):
-            idx = self.index(row, 1)
-            if super().data(idx) == 1:
-                super().setData(idx, 0)
+        # one set-oriented UPDATE instead of a setData round trip per row
+        query = QtSql.QSqlQuery(self.database())
+        if not query.exec_('UPDATE offsets SET Chk = 0 WHERE Chk = 1'):
+            LOG.debug(f"Error: {query.lastError().text()}")
+        self.select()
 
 class MyToolModel(QtSql.QSqlTableModel):
     def __init__(self, parent=None):
@@ -225,31 +269,44 @@ class MyToolModel(QtSql.QSqlTableModel):
         self.setEditStrategy(QtSql.QSqlTableModel.OnFieldChange)
         self.metric_display = True
         self.highlight_color = '#20A0A0'
+        self._tno_to_row = {}
         rec = self.record()
         for i in range(rec.count()):
             hdr = rec.fieldName(i)
             self.setHeaderData(i, Qt.Horizontal, hdr)
             tool_headers[hdr] = i
+        self._col_to_field = tuple(rec.fieldName(i) for i in range(rec.count()))
+        self._editable_cols = frozenset({tool_headers['TOOL'], tool_headers['TIME'], tool_headers['ICON']})
+        self._handled_roles = frozenset({Qt.DisplayRole, Qt.EditRole, Qt.BackgroundRole,
+                                         Qt.TextAlignmentRole})
+        self._float_fmt = "{:.3f}".format
+        self._bg_highlight = QColor(self.highlight_color)
+        self._align_left = Qt.AlignLeft | Qt.AlignVCenter
+        self._align_center = Qt.AlignCenter
+        self._idn_col = tool_headers['idn']
+        self._tool_col = tool_headers['TOOL']
+        self._time_col = tool_headers['TIME']
+        self._icon_col = tool_headers['ICON']
         self.select()
 
     def data(self, index, role=Qt.DisplayRole):
-        value = super(MyToolModel, self).data(index, role)
+        if role not in self._handled_roles: return QVariant()
         if role == Qt.EditRole:
-            return value
+            return super(MyToolModel, self).data(index, role)
         if role == Qt.DisplayRole:
+            value = super(MyToolModel, self).data(index, role)
             if isinstance(value, float):
-                if self.metric_display:
-                    return "{:.3f}".format(value)
-                else: return "{:.4f}".format(value)
+                return self._float_fmt(value)
             return value
-        if role == Qt.BackgroundRole and index.column() == tool_headers['TOOL']:
+        if role == Qt.BackgroundRole and index.column() == self._tool_col:
             checked = self.parent.get_checked_tools()
             if checked and index.data() == checked[0]:
-                return QColor(self.highlight_color)
+                return self._bg_highlight
             else: return QVariant()
         if role == Qt.TextAlignmentRole:
-            if index.column() == tool_headers['ICON']: return (Qt.AlignLeft | Qt.AlignVCenter)
-            else: return Qt.AlignCenter
+            if index.column() == self._icon_col: return self._align_left
+            else: return self._align_center
+        return QVariant()
 
     def setData(self, index, value, role=Qt.EditRole):
         if not index.isValid(): return False
@@ -263,36 +320,40 @@ class MyToolModel(QtSql.QSqlTableModel):
     def flags(self, index):
         if not index.isValid():
             return None
-        field = self.record().fieldName(index.column())
-        if field in ['TOOL', 'TIME', 'ICON']:
+        if index.column() in self._editable_cols:
             return Qt.ItemIsEditable | Qt.ItemIsEnabled
         else:
             return Qt.ItemIsEditable | Qt.ItemIsEnabled | Qt.ItemIsSelectable
 
+    def select(self):
+        ok = super(MyToolModel, self).select()
+        self._tno_to_row = {self.record(row).value('TOOL'): row for row in range(super().rowCount())}
+        return ok
+
+    def set_metric_mode(self, state):
+        self.metric_display = state
+        self._float_fmt = ("{:.3f}" if state else "{:.4f}").format
+        self.dataChanged.emit(self.index(0, 0), self.index(self.rowCount(self) - 1, self.columnCount() - 1))
+
     def update_tool_no(self, old_tno, new_tno):
         row = self.get_index(old_tno)
+        if row is None: return
         col = tool_headers['TOOL']
         idx = self.index(row, col)
         self.setData(idx, new_tno)
+        self._tno_to_row[new_tno] = self._tno_to_row.pop(old_tno)
 
     def get_index(self, tno):
-        col = tool_headers['TOOL']
-        count = self.rowCount(self)
-        found = None
-        for row in range(count):
-            idx = self.index(row, col)
-            if self.data(idx) == tno:
-                found = row
-                break
-        return found
+        return self._tno_to_row.get(tno)
 
     def addrow(self, pkey, tno):
         row = self.rowCount(self)
         rec = self.record()
-        rec.setValue('idn', pkey)
-        rec.setValue('TOOL', tno)
-        rec.setValue('TIME', 0.0)
+        rec.setValue(self._idn_col, pkey)
+        rec.setValue(self._tool_col, tno)
+        rec.setValue(self._time_col, 0.0)
         if not self.insertRecord(row, rec): LOG.debug(f"Error: {self.lastError().text()}")
+        self._tno_to_row[tno] = row
         
 
 class Tool_Database(QTabWidget):
@@ -303,7 +364,9 @@ class Tool_Database(QTabWidget):
         self.query = None
         self.enable_edit = False
         self.current_row = 0
-        self.timer_dict = {'running': False, 'tool': 0, 'time': 0}
+        self.timer_running = False
+        self.timer_tool = 0
+        self.timer_time = 0
         self.timer_tenths = 0
         self.next_available = 0
         self.axis_list = INFO.AVAILABLE_AXES
@@ -319,7 +382,8 @@ class Tool_Database(QTabWidget):
         if 'tools' not in self.tables:
             LOG.debug("Creating tools table")
             self.create_tool_table()
- 
+        self.create_indexes()
+
         LOG.debug("Database tables: {}".format(self.tables))
         self.tool_model = MyToolModel(self)
         self.offset_model = MyOffsetModel(self)
@@ -327,6 +391,9 @@ class Tool_Database(QTabWidget):
         self.tool_view = QTableView()
         self.proxyModel = QSortFilterProxyModel()
         self.proxyModel.setSourceModel(self.offset_model)
+        # don't re-sort/filter on every dataChanged from bulk updates;
+        # sorting is driven by the view headers
+        self.proxyModel.setDynamicSortFilter(False)
 
         self.init_tool_view()
         self.init_offset_view()
@@ -336,7 +403,7 @@ class Tool_Database(QTabWidget):
     def hal_init(self):
         STATUS.connect('all-homed', lambda w: self.setEnabled(True))
         STATUS.connect('not-all-homed', lambda w, axis: self.setEnabled(False))
-        STATUS.connect('periodic', lambda w: self.tool_timer())
+        STATUS.connect('periodic', self._on_periodic)
         STATUS.connect('interp-idle', lambda w: self.interp_state(False))
         STATUS.connect('interp-run', lambda w: self.interp_state(True))
         STATUS.connect('tool-in-spindle-changed', lambda w, tool: self.tool_changed(tool))
@@ -401,6 +468,16 @@ class Tool_Database(QTabWidget):
         else:
             LOG.debug("Create tool table error: {}".format(self.query.lastError().text()))
 
+    def create_indexes(self):
+        # tool number is the lookup and sort key for both tables; the partial
+        # Chk index keeps the checked-tool scan cheap. IF NOT EXISTS makes
+        # this safe to run on databases created by older versions.
+        for stmt in ('CREATE INDEX IF NOT EXISTS idx_offsets_tool ON offsets(Tool)',
+                     'CREATE INDEX IF NOT EXISTS idx_tools_tool ON tools(TOOL)',
+                     'CREATE INDEX IF NOT EXISTS idx_offsets_chk ON offsets(Chk) WHERE Chk = 1'):
+            if not self.query.exec_(stmt):
+                LOG.debug("Create index error: {}".format(self.query.lastError().text()))
+
     def init_tool_view(self):
         self.tool_view.setModel(self.tool_model)
         self.tool_view.hideColumn(0)
@@ -440,24 +517,24 @@ class Tool_Database(QTabWidget):
         self.offset_view.clicked.connect(self.showOffsetSelection)
 
     def start_tool_timer(self):
-        tno = self.timer_dict['tool']
+        tno = self.timer_tool
         if tno == 0: return
         LOG.debug(f"Starting timer for tool {tno}")
-        self.timer_dict['running'] = True
+        self.timer_running = True
         row = self.offset_model.get_index(tno)
         if row is None: return
         idx = self.tool_model.index(row, tool_headers['TIME'])
         pre_time = float(self.tool_model.data(idx))
-        self.timer_dict['time'] = int(pre_time * 60)
+        self.timer_time = int(pre_time * 60)
 
     def stop_tool_timer(self):
-        if not self.timer_dict['running']: return
-        tno = self.timer_dict['tool']
+        if not self.timer_running: return
+        tno = self.timer_tool
         LOG.debug(f"Stopping timer for tool {tno}")
-        self.timer_dict['running'] = False
+        self.timer_running = False
         row = self.offset_model.get_index(tno)
         if row is None: return
-        total_time = self.timer_dict['time'] / 60
+        total_time = self.timer_time / 60
         total_time = f"{total_time:.3f}"
         idx = self.tool_model.index(row, tool_headers['TIME'])
         self.tool_model.setData(idx, total_time)
@@ -466,7 +543,7 @@ class Tool_Database(QTabWidget):
     def tool_changed(self, tool):
         self.current_row = None if tool == 0 else self.offset_model.get_index(tool)
         if tool > 0:
-            self.timer_dict['tool'] = tool
+            self.timer_tool = tool
             if STATUS.is_auto_running():
                 self.start_tool_timer()
 
@@ -497,7 +574,7 @@ class Tool_Database(QTabWidget):
     def showOffsetSelection(self, item):
         if self.enable_edit is False: return
         col = item.column()
-        field = self.offset_model.record().fieldName(col)
+        field = self.offset_model._col_to_field[col]
         if field == 'Chk':
             pass
         elif field in offset_headers:
@@ -506,15 +583,16 @@ class Tool_Database(QTabWidget):
     def showToolSelection(self, item):
         if self.enable_edit is False: return
         col = item.column()
-        field = self.tool_model.record().fieldName(col)
+        field = self.tool_model._col_to_field[col]
         if field in ['TOOL', 'TIME', 'ICON']: return
         elif field in tool_headers:
             self.callToolDialog(item, field)
 
     def callToolDialog(self, item, field):
-        idx = self.offset_model.index(item.row(), offset_headers['Tool'])
+        row = item.row()
+        idx = self.offset_model.index(row, offset_headers['Tool'])
         tool = self.offset_model.data(idx)
-        idx = self.tool_model.index(item.row(), tool_headers[field])
+        idx = self.tool_model.index(row, tool_headers[field])
         header = f'Tool {tool} Data'
         preload = self.tool_model.data(idx)
         if field == 'RPM':
@@ -537,9 +615,10 @@ class Tool_Database(QTabWidget):
             if ok: self.tool_model.setData(idx, ret_val)
 
     def callOffsetDialog(self, item, field):
-        idx = self.offset_model.index(item.row(), offset_headers['Tool'])
+        row = item.row()
+        idx = self.offset_model.index(row, offset_headers['Tool'])
         tool = self.offset_model.data(idx)
-        idx = self.offset_model.index(item.row(), offset_headers[field])
+        idx = self.offset_model.index(row, offset_headers[field])
         header = f'Tool {tool} Offsets'
         preload = self.offset_model.data(idx)
         changed = True
@@ -548,6 +627,8 @@ class Tool_Database(QTabWidget):
             if ok:
                 self.offset_model.setData(idx, ret_val)
                 self.offset_model.tool_list = [ret_val if item == preload else item for item in self.offset_model.tool_list]
+                self.offset_model._tool_set = set(self.offset_model.tool_list)
+                self.offset_model._tno_to_row[ret_val] = self.offset_model._tno_to_row.pop(preload)
                 self.tool_model.update_tool_no(preload, ret_val)
             else: changed = False
         elif field == 'Pocket':
@@ -563,41 +644,45 @@ class Tool_Database(QTabWidget):
             if ok: self.offset_model.setData(idx, ret_val)
             else: changed = False
         else:
-            axis = self.offset_model.record().fieldName(item.column())
+            axis = self.offset_model._col_to_field[item.column()]
             title = f"Axis {axis} Offset {item.data()}"
             ret_val, ok = QInputDialog.getDouble(self, header, title, float(preload), decimals=3)
             if ok: self.offset_model.setData(idx, ret_val)
             else: changed = False
         if changed: self.data_changed()
 
+    def _on_periodic(self, w):
+        self.tool_timer()
+
     def tool_timer(self):
-        self.timer_tenths += 1
-        if self.timer_tenths == 10:
-            self.timer_tenths = 0
-            if self.timer_dict['running'] is True:
-                self.timer_dict['time'] += 1
+        # runs every 100ms - count a second on every tenth tick without branching
+        self.timer_tenths = (self.timer_tenths + 1) % 10
+        self.timer_time += (self.timer_tenths == 0) & self.timer_running
 
 ## calls from host
     def add_tool(self, tno):
         LOG.debug(f"Add tool {tno}")
         array = [tno, tno, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0, 'New tool']
         TOOL.ADD_TOOL(array)
-        self.offset_model.update()
+        self.offset_model.add_one(array)
 
     def delete_tool(self, tno):
         LOG.debug(f"Deleting tool {tno}")
         TOOL.DELETE_TOOLS(tno)
-        self.offset_model.update()
+        self.offset_model.remove_one(tno)
 
     def save_table(self):
+        # fetch raw values in one SELECT instead of going through the
+        # model's data() for every cell
         array = []
-        for row in range(self.offset_model.rowCount(self)):
-            line = []
-            for hdr in offset_headers:
-                idx = self.offset_model.index(row, offset_headers[hdr])
-                data = self.offset_model.data(idx)
-                line.append(data)
-            array.append(line)
+        query = QtSql.QSqlQuery(self.offset_model.database())
+        sql = 'SELECT {} FROM offsets ORDER BY idn'.format(','.join(offset_headers))
+        if not query.exec_(sql):
+            LOG.debug(f"Error: {query.lastError().text()}")
+            return array
+        cols = len(offset_headers)
+        while query.next():
+            array.append([query.value(i) for i in range(cols)])
         return array
 
     def set_edit_mode(self, mode):
@@ -607,8 +692,8 @@ class Tool_Database(QTabWidget):
         return self.offset_model.list_checked_tools()
 
     def set_metric_mode(self, state):
-        self.offset_model.metric_display = state
-        self.tool_model.metric_display = state
+        self.offset_model.set_metric_mode(state)
+        self.tool_model.set_metric_mode(state)
 
     def set_tool_icon(self, icon):
         checked = self.get_checked_tools()
@@ -628,8 +713,8 @@ class Tool_Database(QTabWidget):
         return None
 
     def get_next_available(self):
-        for tno in range(0, 100):
-            if tno not in self.offset_model.tool_list: break
+        available = set(range(100)) - self.offset_model._tool_set
+        tno = min(available) if available else 99
         self.next_available = tno
         return tno
 
@@ -669,41 +754,29 @@ class Tool_Database(QTabWidget):
         cursor.insertText('QtDragon Tool Table', hdr_format)
         # first page
         cursor.setPosition(first_page.firstPosition())
-        rows = self.offset_model.rowCount(self) + 1
-        cols = len(self.hdr_list) - 1
-        table1 = cursor.insertTable(rows, cols, table_format)
-        i = 0
-        for hdr in self.hdr_list:
-            if hdr == 'Chk': continue
+        offset_fields = [hdr for hdr in self.hdr_list if hdr != 'Chk']
+        lines = self.fetch_table_rows('offsets', offset_fields, self.offset_model._float_fmt)
+        table1 = cursor.insertTable(len(lines) + 1, len(offset_fields), table_format)
+        cursor.beginEditBlock()
+        for i, hdr in enumerate(offset_fields):
             table1.cellAt(0, i).firstCursorPosition().insertText(hdr, hdr_format)
-            i += 1
-        for row in range(1, rows):
-            i = 0
-            for hdr in self.hdr_list:
-                if hdr == 'Chk': continue
-                col = offset_headers[hdr]
-                idx = self.offset_model.index(row-1, col)
-                table1.cellAt(row, i).firstCursorPosition().insertText(str(self.offset_model.data(idx)), std_format)
-                i += 1
+        for row, line in enumerate(lines, 1):
+            for i, text in enumerate(line):
+                table1.cellAt(row, i).firstCursorPosition().insertText(text, std_format)
+        cursor.endEditBlock()
         # second page
         cursor.setPosition(second_page.firstPosition())
-        rows = self.tool_model.rowCount(self) + 1
-        cols = len(tool_headers) - 1
-        table2 = cursor.insertTable(rows, cols, table_format)
-        i = 0
-        for hdr in tool_headers:
-            if hdr == 'idn': continue
+        tool_fields = [hdr for hdr in tool_headers if hdr != 'idn']
+        lines = self.fetch_table_rows('tools', tool_fields, self.tool_model._float_fmt)
+        table2 = cursor.insertTable(len(lines) + 1, len(tool_fields), table_format)
+        cursor.beginEditBlock()
+        for i, hdr in enumerate(tool_fields):
             table2.cellAt(0, i).firstCursorPosition().insertText(hdr, hdr_format)
-            i += 1
-        for row in range(1, rows):
-            i = 0
-            for hdr in tool_headers:
-                if hdr == 'idn': continue
-                col = tool_headers[hdr]
-                idx = self.tool_model.index(row-1, col)
-                table2.cellAt(row, i).firstCursorPosition().insertText(str(self.tool_model.data(idx)), std_format)
-                i += 1
-    
+        for row, line in enumerate(lines, 1):
+            for i, text in enumerate(line):
+                table2.cellAt(row, i).firstCursorPosition().insertText(text, std_format)
+        cursor.endEditBlock()
+
         saveName = self.get_file_save("Select Save Filename")
         if saveName != '':
             printer = QPrinter()
@@ -712,6 +785,23 @@ class Tool_Database(QTabWidget):
             printer.setOutputFileName(saveName)
             doc.print_(printer)
 
+    def fetch_table_rows(self, table, fields, float_fmt):
+        # one SELECT per table instead of a model data() call per cell
+        lines = []
+        query = QtSql.QSqlQuery(self.offset_model.database())
+        sql = 'SELECT {} FROM {} ORDER BY {}'.format(','.join(fields), table, fields[0])
+        if not query.exec_(sql):
+            LOG.debug(f"Error: {query.lastError().text()}")
+            return lines
+        cols = len(fields)
+        while query.next():
+            line = []
+            for i in range(cols):
+                value = query.value(i)
+                line.append(float_fmt(value) if isinstance(value, float) else str(value))
+            lines.append(line)
+        return lines
+
     def get_file_save(self, caption):
         dialog = QFileDialog()
         options = QFileDialog.Options()